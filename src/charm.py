@@ -4,9 +4,10 @@
 
 """Charmed k8s Operator for Apache ZooKeeper."""
 
+import hashlib
 import logging
-import time
 from datetime import datetime
+from functools import cached_property
 
 from charms.data_platform_libs.v0.data_models import TypedCharmBase
 from charms.grafana_k8s.v0.grafana_dashboard import GrafanaDashboardProvider
@@ -22,6 +23,7 @@ from ops import (
     RelationDepartedEvent,
     SecretChangedEvent,
     StatusBase,
+    StoredState,
     WaitingStatus,
     main,
 )
@@ -42,9 +44,8 @@ from literals import (
     CLIENT_PORT,
     CONTAINER,
     DEPENDENCIES,
-    JMX_PORT,
     LOGS_RULES_DIR,
-    METRICS_PROVIDER_PORT,
+    METRICS_JOBS,
     METRICS_RULES_DIR,
     PEER,
     SUBSTRATE,
@@ -61,17 +62,36 @@ logger = logging.getLogger(__name__)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 
+# core charm events and the names of the charm methods observing them
+CORE_EVENT_HANDLERS = (
+    ("install", "_on_install"),
+    ("update_status", "_on_cluster_relation_changed"),
+    ("upgrade_charm", "_on_zookeeper_pebble_ready"),
+    ("start", "_on_zookeeper_pebble_ready"),
+    ("zookeeper_pebble_ready", "_on_zookeeper_pebble_ready"),
+    ("leader_elected", "_on_cluster_relation_changed"),
+    ("config_changed", "_on_cluster_relation_changed"),
+    ("secret_changed", "_on_secret_changed"),
+    ("cluster_relation_changed", "_on_cluster_relation_changed"),
+    ("cluster_relation_joined", "_on_cluster_relation_changed"),
+    ("cluster_relation_departed", "_on_cluster_relation_changed"),
+)
+
 
 class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
     """Charmed Operator for ZooKeeper K8s."""
 
     config_type = CharmConfig
+    # unit-local, so that storing the reconcile hash doesn't wake up the other units
+    _stored = StoredState()
 
     def __init__(self, *args):
         super().__init__(*args)
         self.name = CHARM_KEY
+        self._stored.set_default(reconcile_hash="")
+        self._reconciled = False
+        self._workload_version = ""
         self.state = ClusterState(self, substrate=SUBSTRATE)
-        self.workload = ZKWorkload(container=self.unit.get_container(CONTAINER))
 
         # --- CHARM EVENT HANDLERS ---
 
@@ -87,19 +107,6 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             ),
         )
 
-        # --- MANAGERS ---
-
-        self.quorum_manager = QuorumManager(state=self.state)
-        self.tls_manager = TLSManager(
-            state=self.state, workload=self.workload, substrate=SUBSTRATE
-        )
-        self.config_manager = ConfigManager(
-            state=self.state, workload=self.workload, substrate=SUBSTRATE, config=self.config
-        )
-        self.k8s_manager = K8sManager(
-            pod_name=self.state.unit_server.pod_name, namespace=self.model.name
-        )
-
         # --- LIB EVENT HANDLERS ---
 
         self.restart = RollingOpsManager(self, relation="restart", callback=self._restart)
@@ -108,9 +115,7 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             self,
             refresh_event=self.on.start,
             alert_rules_path=METRICS_RULES_DIR,
-            jobs=[
-                {"static_configs": [{"targets": [f"*:{JMX_PORT}", f"*:{METRICS_PROVIDER_PORT}"]}]}
-            ],
+            jobs=METRICS_JOBS,
         )
         self.loki_push = LogProxyConsumer(
             self,
@@ -121,36 +126,53 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         )
         # --- CORE EVENTS ---
 
-        self.framework.observe(getattr(self.on, "install"), self._on_install)
-        self.framework.observe(
-            getattr(self.on, "update_status"), self._on_cluster_relation_changed
-        )
-        self.framework.observe(getattr(self.on, "upgrade_charm"), self._on_zookeeper_pebble_ready)
-        self.framework.observe(getattr(self.on, "start"), self._on_zookeeper_pebble_ready)
-        self.framework.observe(
-            getattr(self.on, "zookeeper_pebble_ready"), self._on_zookeeper_pebble_ready
-        )
-        self.framework.observe(
-            getattr(self.on, "leader_elected"), self._on_cluster_relation_changed
-        )
-        self.framework.observe(
-            getattr(self.on, "config_changed"), self._on_cluster_relation_changed
-        )
-        self.framework.observe(getattr(self.on, "secret_changed"), self._on_secret_changed)
+        for event, handler in CORE_EVENT_HANDLERS:
+            self.framework.observe(getattr(self.on, event), getattr(self, handler))
 
-        self.framework.observe(
-            getattr(self.on, "cluster_relation_changed"), self._on_cluster_relation_changed
-        )
-        self.framework.observe(
-            getattr(self.on, "cluster_relation_joined"), self._on_cluster_relation_changed
-        )
-        self.framework.observe(
-            getattr(self.on, "cluster_relation_departed"), self._on_cluster_relation_changed
+    # --- MANAGERS ---
+    # built on first use, as most hooks only need a few of them
+
+    @cached_property
+    def workload(self) -> ZKWorkload:
+        """The ZooKeeper workload running in the unit container."""
+        return ZKWorkload(container=self.unit.get_container(CONTAINER))
+
+    @cached_property
+    def quorum_manager(self) -> QuorumManager:
+        """Manager for the ZooKeeper quorum members and ACLs."""
+        return QuorumManager(state=self.state)
+
+    @cached_property
+    def tls_manager(self) -> TLSManager:
+        """Manager for the unit TLS keys, certificates and stores."""
+        return TLSManager(state=self.state, workload=self.workload, substrate=SUBSTRATE)
+
+    @cached_property
+    def config_manager(self) -> ConfigManager:
+        """Manager for the ZooKeeper config files."""
+        return ConfigManager(
+            state=self.state, workload=self.workload, substrate=SUBSTRATE, config=self.config
         )
 
+    @cached_property
+    def k8s_manager(self) -> K8sManager:
+        """Manager for the ZooKeeper Kubernetes resources."""
+        return K8sManager(pod_name=self.state.unit_server.pod_name, namespace=self.model.name)
+
     @property
+    def workload_version(self) -> str:
+        """The running ZooKeeper version, queried from the workload once per hook."""
+        if not self._workload_version:
+            self._workload_version = self.workload.get_version()
+
+        return self._workload_version
+
+    @cached_property
     def _layer(self) -> Layer:
-        """Returns a Pebble configuration layer for ZooKeeper on K8s."""
+        """Returns a Pebble configuration layer for ZooKeeper on K8s.
+
+        Cached for the lifetime of the charm instance, i.e a single hook.
+        """
         layer_config: "LayerDict" = {
             "summary": "zookeeper layer",
             "description": "Pebble config layer for zookeeper",
@@ -179,6 +201,18 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         }
         return Layer(layer_config)
 
+    @cached_property
+    def _peer_extra_secret_label(self) -> str | None:
+        """The label of the peer relation secret holding the app data."""
+        if not self.state.cluster.relation:
+            return None
+
+        return self.state.cluster.data_interface._generate_secret_label(
+            PEER,
+            self.state.cluster.relation.id,
+            "extra",  # type:ignore noqa  -- Changes with the https://github.com/canonical/data-platform-libs/issues/124
+        )
+
     def update_external_services(self) -> None:
         """Attempts to update any external Kubernetes services."""
         if not SUBSTRATE == "k8s" or not self.unit.is_leader():
@@ -210,19 +244,39 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             event.defer()
             return
 
-        if self.unit.is_leader() and not self.state.cluster.internal_user_credentials:
-            for user in CHARM_USERS:
-                self.state.cluster.update({f"{user}-password": self.workload.generate_password()})
-
-        # give the leader a default quorum during cluster initialisation
         if self.unit.is_leader():
-            self.state.cluster.update({"quorum": "default - non-ssl"})
+            cluster = self.state.cluster
+            # give the leader a default quorum during cluster initialisation
+            updates = {"quorum": "default - non-ssl"}
+
+            if not cluster.internal_user_credentials:
+                updates |= {
+                    f"{user}-password": self.workload.generate_password() for user in CHARM_USERS
+                }
+
+            cluster.update(updates)
 
-        self.unit.set_workload_version(self.workload.get_version())
+        self.unit.set_workload_version(self.workload_version)
         self.update_external_services()
 
-    def _on_cluster_relation_changed(self, event: EventBase) -> None:  # noqa: C901
+    def _on_cluster_relation_changed(self, event: EventBase) -> None:
         """Generic handler for all 'something changed, update' events across all relations."""
+        # deferred events are re-emitted in the same dispatch as the current hook
+        # only reconcile once, unless the event needs to act on quorum membership changes
+        if self._reconciled and not isinstance(event, (RelationDepartedEvent, LeaderElectedEvent)):
+            logger.debug(f"Already reconciled during this hook, skipping {event}")
+            return
+
+        self._reconcile(event)
+        self._reconciled = not event.deferred
+
+    def _reconcile(self, event: EventBase) -> None:  # noqa: C901
+        """Updates the unit and cluster to match the current state of all relations.
+
+        Handlers that change the state themselves call this directly, skipping the once-per-hook
+        check in `_on_cluster_relation_changed`, as any deferred event re-emitted earlier in
+        the hook ran with the previous state.
+        """
         # NOTE: k8s specific check, the container needs to be available before moving on
         if not self.workload.container_can_connect:
             self._set_status(Status.CONTAINER_NOT_CONNECTED)
@@ -234,19 +288,26 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             self._set_status(Status.NO_PEER_RELATION)
             return
 
-        if self.state.cluster.is_restore_in_progress:
+        unit_server = self.state.unit_server
+        cluster = self.state.cluster
+
+        if cluster.is_restore_in_progress:
             # Ongoing backup restore, we can early return here since the
             # chain of events is only relevant to the backup event handler
             return
 
         # don't want to prematurely set config using outdated/missing relation data
         # also skip update-status overriding statues during upgrades
-        if not self.upgrade_events.idle:
+        upgrade_idle = self.upgrade_events.idle
+        if not upgrade_idle:
             event.defer()
             return
 
+        # read before any of the steps below update the status
+        was_active = isinstance(self.unit.status, ActiveStatus)
+
         # attempt startup of server
-        if not self.state.unit_server.started:
+        if not unit_server.started:
             self.init_server()
 
         # create services if we expose the charm, no op if not
@@ -254,7 +315,8 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
 
         # since the next steps will 1. update the unit status to active and 2. update the clients,
         # we want to check if the external access is all good before proceeding
-        if not self.state.endpoints:
+        endpoints = self.state.endpoints
+        if not endpoints:
             logger.info("Endpoints not yet known, deferring")
             self.disconnect_clients()
             event.defer()
@@ -263,14 +325,15 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         # if we were already using tls while a network change comes up, we need to expire
         # existing certificates
         current_sans = self.tls_manager.get_current_sans()
+        expected_sans = self.tls_manager.build_sans() if current_sans else None
 
         current_sans_ip = set(current_sans.sans_ip) if current_sans else set()
-        expected_sans_ip = set(self.tls_manager.build_sans().sans_ip) if current_sans else set()
-        sans_ip_changed = current_sans_ip ^ expected_sans_ip
+        expected_sans_ip = set(expected_sans.sans_ip) if expected_sans else set()
+        sans_ip_changed = current_sans_ip != expected_sans_ip
 
         current_sans_dns = set(current_sans.sans_dns) if current_sans else set()
-        expected_sans_dns = set(self.tls_manager.build_sans().sans_dns) if current_sans else set()
-        sans_dns_changed = current_sans_dns ^ expected_sans_dns
+        expected_sans_dns = set(expected_sans.sans_dns) if expected_sans else set()
+        sans_dns_changed = current_sans_dns != expected_sans_dns
 
         if sans_ip_changed or sans_dns_changed:
             logger.info(
@@ -283,15 +346,27 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
                 )
             )
             self.tls_events.certificates.on.certificate_expiring.emit(
-                certificate=self.state.unit_server.certificate,
+                certificate=unit_server.certificate,
                 expiry=datetime.now().isoformat(),
             )  # new cert will eventually be dynamically loaded by the server
-            self.state.unit_server.update(
+            unit_server.update(
                 {"certificate": ""}
             )  # ensures only single requested new certs, will be replaced on new certificate-available event
 
             return  # early return here to ensure new node cert arrives before updating the clients
 
+        # skip updating quorum, config and clients if nothing changed since the last full run
+        # scale-down and leader changes always run to maintain quorum
+        reconcile_hash = self._reconcile_hash(endpoints=endpoints)
+        if (
+            reconcile_hash == self._stored.reconcile_hash
+            and was_active
+            and not isinstance(event, (RelationDepartedEvent, LeaderElectedEvent))
+        ):
+            logger.debug("No changes since last reconcile, skipping")
+            self._set_status(self._workload_status())
+            return
+
         # even if leader has not started, attempt update quorum
         self.update_quorum(event=event)
 
@@ -299,46 +374,45 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         if getattr(event, "departing_unit", None) == self.unit:
             return
 
+        # read after updating quorum, as the leader may have completed the switch
+        switching_encryption = cluster.switching_encryption
+
         # check whether restart is needed for all `*_changed` events
         # only restart where necessary to avoid slowdowns
         # config_changed call here implicitly updates jaas + zoo.cfg
-        if (
-            (self.config_manager.config_changed() or self.state.cluster.switching_encryption)
-            and self.state.unit_server.started
-            and self.upgrade_events.idle
-        ):
+        restart_needed = self.config_manager.config_changed() or switching_encryption
+        if restart_needed and unit_server.started and upgrade_idle:
             self.on[f"{self.restart.name}"].acquire_lock.emit()
 
         # ensures events aren't lost during an upgrade on single units
-        if self.state.cluster.switching_encryption and len(self.state.servers) == 1:
+        if switching_encryption and len(self.state.servers) == 1:
             event.defer()
 
-        if not self.workload.alive:
-            self._set_status(Status.SERVICE_NOT_RUNNING)
+        if (status := self._workload_status()) != Status.ACTIVE:
+            self._set_status(status)
             return
 
-        # service can stop serving requests if the quorum is lost
-        if self.state.unit_server.started and not self.workload.healthy:
-            self._set_status(Status.SERVICE_UNHEALTHY)
-            return
+        self.unit.set_workload_version(self.workload_version)
+
+        # clients only get their data once the config files include their credentials
+        # and the leader retries adding servers on update-status while the quorum is stale
+        # so keep running in full until both have settled
+        quorum_settled = self.state.stable == Status.ACTIVE and (
+            not self.unit.is_leader() or self.state.ready == Status.ACTIVE
+        )
+        if not restart_needed and quorum_settled:
+            self._stored.reconcile_hash = reconcile_hash
 
-        self.unit.set_workload_version(self.workload.get_version())
         self._set_status(Status.ACTIVE)
 
     def _on_secret_changed(self, event: SecretChangedEvent) -> None:
         """Reconfigure services on a secret changed event."""
-        if not event.secret.label:
+        # most secrets in the model are unrelated to the peer relation
+        if not event.secret.label or not event.secret.label.startswith(PEER):
             return
 
-        if not self.state.cluster.relation:
-            return
-
-        if event.secret.label == self.state.cluster.data_interface._generate_secret_label(
-            PEER,
-            self.state.cluster.relation.id,
-            "extra",  # type:ignore noqa  -- Changes with the https://github.com/canonical/data-platform-libs/issues/124
-        ):
-            self._on_cluster_relation_changed(event)
+        if event.secret.label == self._peer_extra_secret_label:
+            self._reconcile(event)
 
     def _on_zookeeper_pebble_ready(self, event: EventBase) -> None:
         """Handler for the `upgrade-charm`, `zookeeper-pebble-ready` and `start` events.
@@ -373,15 +447,19 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             return
 
         logger.info(f"{self.unit.name} restarting...")
+        layer = self._layer
         current_plan = self.workload.container.get_plan()
-        if current_plan.services != self._layer.services:
-            self.workload.start(layer=self._layer)
+        if current_plan.services != layer.services:
+            self.workload.start(layer=layer)
         else:
             self.workload.restart()
 
-        # gives time for server to rejoin quorum, as command exits too fast
+        self._workload_version = ""
+
+        # waits for server to rejoin quorum, as command exits too fast
         # without, other units might restart before this unit rejoins, losing quorum
-        time.sleep(5)
+        if not self.workload.ready:
+            logger.warning(f"{self.unit.name} has not rejoined the quorum after restarting")
 
         self.state.unit_server.update(
             {
@@ -402,8 +480,11 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         Sets myid, server_jvmflgas env_var, initial servers in dynamic properties,
             default properties and jaas_config
         """
+        unit_server = self.state.unit_server
+        cluster = self.state.cluster
+
         # don't run if leader has not yet created passwords
-        if not self.state.cluster.internal_user_credentials:
+        if not cluster.internal_user_credentials:
             self._set_status(Status.NO_PASSWORDS)
             return
 
@@ -414,11 +495,12 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             return
 
         # start units in order
+        next_server = self.state.next_server
         if (
-            self.state.next_server
-            and self.state.next_server.component
-            and self.state.unit_server.component
-            and self.state.next_server.component.name != self.state.unit_server.component.name
+            next_server
+            and next_server.component
+            and unit_server.component
+            and next_server.component.name != unit_server.component.name
         ):
             self._set_status(Status.NOT_UNIT_TURN)
             return
@@ -438,12 +520,8 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         self.config_manager.set_client_jaas_config()
 
         # during pod-reschedules (e.g upgrades or otherwise) we lose all files
-        # need to manually add-back key/truststores
-        if (
-            self.state.cluster.tls
-            and self.state.unit_server.certificate
-            and self.state.unit_server.ca_cert
-        ):  # TLS is probably completed
+        # need to manually add-back key/truststores, if TLS is probably completed
+        if cluster.tls and unit_server.certificate and unit_server.ca_cert:
             self.tls_manager.set_private_key()
             self.tls_manager.set_ca()
             self.tls_manager.set_chain()
@@ -454,20 +532,55 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
 
         logger.debug("starting ZooKeeper service")
         self.workload.start(layer=self._layer)
+        self._workload_version = ""
 
         # unit flags itself as 'started' so it can be retrieved by the leader
         logger.info(f"{self.unit.name} started")
-        self.unit.set_workload_version(self.workload.get_version())
+        self.unit.set_workload_version(self.workload_version)
 
         # added here in case a `restart` was missed
-        self.state.unit_server.update(
+        unit_server.update(
             {
                 "state": "started",
-                "unified": "true" if self.state.cluster.switching_encryption else "",
-                "quorum": self.state.cluster.quorum,
+                "unified": "true" if cluster.switching_encryption else "",
+                "quorum": cluster.quorum,
             }
         )
 
+    def _workload_status(self) -> Status:
+        """Gets the unit status from the state of the running workload."""
+        if not self.workload.alive:
+            return Status.SERVICE_NOT_RUNNING
+
+        # service can stop serving requests if the quorum is lost
+        if self.state.unit_server.started and not self.workload.healthy:
+            return Status.SERVICE_UNHEALTHY
+
+        return Status.ACTIVE
+
+    def _reconcile_hash(self, endpoints: str) -> str:
+        """Builds a digest of the inputs used when updating the quorum, config and clients.
+
+        Computed before any of those are updated, so that a reconcile which changes
+        its own inputs is always followed by another full run.
+
+        Args:
+            endpoints: the current client endpoints, including any external addresses
+        """
+        servers_data = sorted(
+            (server.unit_id, sorted(server.relation_data.items())) for server in self.state.servers
+        )
+        inputs = (
+            self.config.dict(),
+            # includes the client passwords, set once their ACLs are created
+            sorted(self.state.cluster.relation_data.items()),
+            servers_data,
+            self.state.cluster.tls,
+            endpoints,
+        )
+
+        return hashlib.blake2b(repr(inputs).encode()).hexdigest()
+
     def update_quorum(self, event: EventBase) -> None:
         """Updates the server quorum members for all currently started units in the relation.
 
@@ -476,11 +589,13 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         if not self.unit.is_leader() or getattr(event, "departing_unit", None) == self.unit:
             return
 
+        cluster = self.state.cluster
+
         # set first unit to "added" asap to get the units starting sooner
         # sets to "added" for init quorum leader, if not already exists
         # may already exist if during the case of a failover of the first unit
         if (init_leader := self.state.init_leader) and init_leader.started:
-            self.state.cluster.update({str(init_leader.unit_id): "added"})
+            cluster.update({str(init_leader.unit_id): "added"})
 
         if (
             self.state.stale_quorum  # in the case of scale-up
@@ -494,7 +609,7 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             logger.debug(f"{updated_servers=}")
 
             # triggers a `cluster_relation_changed` to wake up following units
-            self.state.cluster.update(updated_servers)
+            cluster.update(updated_servers)
 
         # default startup without ssl relation
         logger.debug("updating quorum - checking cluster stability")
@@ -506,19 +621,19 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         # triggers `cluster_relation_changed` to rolling-restart without `portUnification`
         if self.state.all_units_unified:
             logger.debug("all units unified")
-            if self.state.cluster.tls:
+            if cluster.tls:
                 logger.debug("tls enabled - switching to ssl")
-                self.state.cluster.update({"quorum": "ssl"})
+                cluster.update({"quorum": "ssl"})
             else:
                 logger.debug("tls disabled - switching to non-ssl")
-                self.state.cluster.update({"quorum": "non-ssl"})
+                cluster.update({"quorum": "non-ssl"})
 
             if self.state.all_units_quorum:
                 logger.debug(
                     "all units running desired encryption - removing switching-encryption"
                 )
-                self.state.cluster.update({"switching-encryption": ""})
-                logger.info(f"ZooKeeper cluster switching to {self.state.cluster.quorum} quorum")
+                cluster.update({"switching-encryption": ""})
+                logger.info(f"ZooKeeper cluster switching to {cluster.quorum} quorum")
 
         self.update_client_data()
 
@@ -539,13 +654,20 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         if not isinstance(self.unit.status, ActiveStatus):
             return
 
-        for client in self.state.clients:
+        clients = self.state.clients
+
+        # no need to read the jaas file until some client ACLs have been created
+        current_jaas = (
+            "".join(self.config_manager.current_jaas)
+            if any(client.password for client in clients)
+            else ""
+        )
+
+        for client in clients:
             if (
                 not client.password  # password not set to peer data, i.e ACLs created
                 or client.password
-                not in "".join(
-                    self.config_manager.current_jaas
-                )  # if password in jaas file, unit has probably restarted
+                not in current_jaas  # if password in jaas file, unit has probably restarted
             ):
                 if client.component:
                     logger.debug(
@@ -204,6 +204,7 @@ class ZKCluster(RelationState):
         if not self.relation:
             return
 
+        content = {}
         for key, value in items.items():
             if key in SECRETS_APP or key.startswith("relation-"):
                 if value:
@@ -211,7 +212,10 @@ class ZKCluster(RelationState):
                 else:
                     self.data_interface.delete_secret(self.relation.id, key)
             else:
-                self.data_interface.update_relation_data(self.relation.id, {key: value})
+                content[key] = value
+
+        if content:
+            self.data_interface.update_relation_data(self.relation.id, content)
 
     @property
     def quorum_unit_ids(self) -> list[int]:
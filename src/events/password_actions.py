@@ -85,6 +85,6 @@ class PasswordActionEvents(Object):
         self.charm.state.cluster.update({f"{username}-password": new_password})
 
         # implicitly calls config_changed on leader, other units will get it because of relation-data change with new passwords
-        self.charm._on_cluster_relation_changed(event)
+        self.charm._reconcile(event)
 
         event.set_results({f"{username}-password": new_password})
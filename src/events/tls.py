@@ -134,7 +134,7 @@ class TLSEvents(Object):
         self.charm.tls_manager.set_bundle()
         self.charm.tls_manager.set_truststore()
         self.charm.tls_manager.set_p12_keystore()
-        self.charm.on.config_changed.emit()
+        self.charm._reconcile(event)
 
     def _on_certificate_expiring(self, _: EventBase) -> None:
         """Handler for `certificates_expiring` event when certs need renewing."""
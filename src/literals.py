@@ -16,7 +16,7 @@ CHARM_KEY = "zookeeper-k8s"
 PEER = "cluster"
 REL_NAME = "zookeeper"
 CONTAINER = "zookeeper"
-CHARM_USERS = ["super", "sync"]
+CHARM_USERS = ("super", "sync")
 CERTS_REL_NAME = "certificates"
 CLIENT_PORT = 2181
 SECURE_CLIENT_PORT = 2182
@@ -56,6 +56,7 @@ PATHS = {
 }
 
 METRICS_RULES_DIR = "./src/alert_rules/prometheus"
+METRICS_JOBS = [{"static_configs": [{"targets": [f"*:{JMX_PORT}", f"*:{METRICS_PROVIDER_PORT}"]}]}]
 LOGS_RULES_DIR = "./src/alert_rules/loki"
 
 # --- TYPES ---
@@ -10,7 +10,7 @@ import string
 import httpx
 from ops.model import Container
 from ops.pebble import ChangeError, Layer
-from tenacity import retry, retry_if_result, stop_after_attempt, wait_fixed
+from tenacity import retry, retry_if_result, stop_after_attempt, stop_after_delay, wait_fixed
 from typing_extensions import override
 
 from core.workload import WorkloadBase
@@ -87,11 +87,35 @@ class ZKWorkload(WorkloadBase):
     )
     def healthy(self) -> bool:
         """Flag to check if the unit service is reachable and serving requests."""
+        return self._ruok(timeout=10)
+
+    @property
+    @retry(
+        wait=wait_fixed(0.5),
+        stop=stop_after_delay(5),
+        retry=retry_if_result(lambda result: result is False),
+        retry_error_callback=lambda _: False,
+    )
+    def ready(self) -> bool:
+        """Flag to check if the unit service is serving requests, polling for up to ~5 seconds."""
+        return self._ruok(timeout=0.5)
+
+    def _ruok(self, timeout: float) -> bool:
+        """Sends the `ruok` command to the admin server.
+
+        Args:
+            timeout: seconds to wait for a response
+
+        Returns:
+            True if the service responded without error. Otherwise False
+        """
         if not self.alive:
             return False
 
         try:
-            response = httpx.get(f"http://localhost:{ADMIN_SERVER_PORT}/commands/ruok", timeout=10)
+            response = httpx.get(
+                f"http://localhost:{ADMIN_SERVER_PORT}/commands/ruok", timeout=timeout
+            )
             response.raise_for_status()
 
         except httpx.HTTPError:
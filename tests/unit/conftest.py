@@ -43,6 +43,7 @@ def patched_alive(mocker):
 @pytest.fixture(autouse=True)
 def patched_healthy(mocker):
     mocker.patch("workload.ZKWorkload.healthy", new_callable=PropertyMock, return_value=True)
+    mocker.patch("workload.ZKWorkload.ready", new_callable=PropertyMock, return_value=True)
 
 
 @pytest.fixture(autouse=True)
@@ -3,6 +3,7 @@
 # See LICENSE file for licensing details.
 
 import dataclasses
+import inspect
 import json
 import logging
 import re
@@ -13,12 +14,14 @@ from unittest.mock import DEFAULT, Mock, PropertyMock, patch
 import httpx
 import pytest
 import yaml
+from ops.framework import BoundEvent
 from ops.model import ActiveStatus, BlockedStatus
-from ops.testing import Container, Context, PeerRelation, Relation, State
+from ops.testing import Container, Context, PeerRelation, Relation, Secret, State
 
-from charm import ZooKeeperCharm
+from charm import CORE_EVENT_HANDLERS, ZooKeeperCharm
 from core.models import ZKClient
-from literals import CONTAINER, PEER, REL_NAME, SUBSTRATE, Status
+from core.stubs import SANs
+from literals import CHARM_KEY, CONTAINER, PEER, REL_NAME, SUBSTRATE, Status
 
 logger = logging.getLogger(__name__)
 
@@ -224,6 +227,73 @@ def test_relation_changed_emitted_for_relation_departed(ctx: Context, base_state
     patched.assert_called_once()
 
 
+def test_core_event_handlers_resolve(ctx: Context, base_state: State) -> None:
+    # Given
+    state_in = base_state
+
+    # When
+    with ctx(ctx.on.update_status(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+
+        # Then
+        for event, handler in CORE_EVENT_HANDLERS:
+            assert isinstance(getattr(charm.on, event), BoundEvent)
+            assert inspect.ismethod(getattr(charm, handler))
+
+
+def test_relation_changed_coalesces_deferred_events(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER)
+    deferred = ctx.on.update_status().deferred(ZooKeeperCharm._on_cluster_relation_changed)
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer], deferred=[deferred])
+
+    # When
+    with patch("charm.ZooKeeperCharm._reconcile", autospec=True) as patched:
+        state_out = ctx.run(ctx.on.config_changed(), state_in)
+
+    # Then
+    patched.assert_called_once()
+    assert not state_out.deferred
+
+
+def test_set_password_reconciles_after_deferred_events(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER)
+    deferred = ctx.on.update_status().deferred(ZooKeeperCharm._on_cluster_relation_changed)
+    state_in = dataclasses.replace(
+        base_state, relations=[cluster_peer], deferred=[deferred], leader=True
+    )
+
+    # When
+    with patch("charm.ZooKeeperCharm._reconcile", autospec=True) as patched:
+        ctx.run(
+            ctx.on.action("set-password", params={"username": "super", "password": "mellon"}),
+            state_in,
+        )
+
+    # Then
+    assert patched.call_count == 2
+    assert ctx.action_results == {"super-password": "mellon"}
+
+
+def test_secret_changed_only_reconciles_peer_secret(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER)
+    peer_secret = Secret({"super-password": "mellon"}, label=f"{PEER}.{CHARM_KEY}.app")
+    other_secret = Secret({"password": "mellon"}, label="database.1.user.secret")
+    state_in = dataclasses.replace(
+        base_state, relations=[cluster_peer], secrets=[peer_secret, other_secret]
+    )
+
+    # When
+    with patch("charm.ZooKeeperCharm._reconcile", autospec=True) as patched:
+        ctx.run(ctx.on.secret_changed(other_secret), state_in)
+        ctx.run(ctx.on.secret_changed(peer_secret), state_in)
+
+    # Then
+    patched.assert_called_once()
+
+
 def test_relation_changed_starts_units(ctx: Context, base_state: State) -> None:
     # Given
     cluster_peer = PeerRelation(PEER, PEER, local_app_data={})
@@ -394,6 +464,143 @@ def test_relation_changed_checks_alive_and_healthy(ctx: Context, base_state: Sta
     patched_healthy.assert_called()
 
 
+def test_relation_changed_skips_unchanged_reconcile(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"state": "started"},
+        local_app_data={"0": "added"},
+        peers_data={},
+    )
+    restart_peer = PeerRelation("restart", "rolling_op")
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, restart_peer])
+
+    # When
+    with (
+        patch("core.cluster.ClusterState.all_units_related", return_value=True),
+        patch("core.cluster.ClusterState.all_units_declaring_ip", return_value=True),
+        patch("managers.config.ConfigManager.config_changed", return_value=False),
+        patch("managers.quorum.QuorumManager.update_cluster", return_value={}),
+        patch("charm.ZooKeeperCharm.update_quorum") as patched_update_quorum,
+    ):
+        state_out = ctx.run(ctx.on.config_changed(), state_in)
+        ctx.run(ctx.on.update_status(), state_out)
+
+    # Then
+    assert state_out.unit_status == ActiveStatus()
+    assert state_out.get_stored_state("_stored", owner_path="ZooKeeperCharm").content[
+        "reconcile_hash"
+    ]
+    patched_update_quorum.assert_called_once()
+
+
+def test_relation_changed_checks_sans_when_skipping_reconcile(
+    ctx: Context, base_state: State
+) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"state": "started"},
+        local_app_data={"0": "added"},
+        peers_data={},
+    )
+    restart_peer = PeerRelation("restart", "rolling_op")
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, restart_peer])
+    current_sans = SANs(sans_ip=["1.1.1.1"], sans_dns=["treebeard"])
+
+    # When
+    with (
+        patch("managers.tls.TLSManager.get_current_sans", return_value=current_sans),
+        patch("managers.tls.TLSManager.build_sans", return_value=current_sans),
+        patch("core.cluster.ClusterState.all_units_related", return_value=True),
+        patch("core.cluster.ClusterState.all_units_declaring_ip", return_value=True),
+        patch("managers.config.ConfigManager.config_changed", return_value=False),
+        patch("managers.quorum.QuorumManager.update_cluster", return_value={}),
+        patch("charm.ZooKeeperCharm.update_quorum"),
+    ):
+        state_out = ctx.run(ctx.on.config_changed(), state_in)
+
+    with (
+        patch("managers.tls.TLSManager.get_current_sans", return_value=current_sans),
+        patch(
+            "managers.tls.TLSManager.build_sans",
+            return_value=SANs(sans_ip=["2.2.2.2"], sans_dns=["treebeard"]),
+        ),
+        patch("events.tls.TLSEvents._on_certificate_expiring", autospec=True) as patched_expiring,
+        patch("managers.config.ConfigManager.config_changed", return_value=False),
+        patch("charm.ZooKeeperCharm.update_quorum"),
+    ):
+        ctx.run(ctx.on.update_status(), state_out)
+
+    # Then
+    assert state_out.get_stored_state("_stored", owner_path="ZooKeeperCharm").content[
+        "reconcile_hash"
+    ]
+    patched_expiring.assert_called_once()
+
+
+def test_relation_changed_retries_stale_quorum_on_update_status(
+    ctx: Context, base_state: State
+) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"state": "started"},
+        local_app_data={"0": "added"},
+        peers_data={1: {"state": "started"}},
+    )
+    restart_peer = PeerRelation("restart", "rolling_op")
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, restart_peer], leader=True)
+
+    # When
+    with (
+        patch("core.cluster.ClusterState.all_units_related", return_value=True),
+        patch("core.cluster.ClusterState.all_units_declaring_ip", return_value=True),
+        patch("managers.config.ConfigManager.config_changed", return_value=False),
+        patch(
+            "managers.quorum.QuorumManager.update_cluster", return_value={}
+        ) as patched_update_cluster,
+    ):
+        state_out = ctx.run(ctx.on.update_status(), state_in)
+        ctx.run(ctx.on.update_status(), state_out)
+
+    # Then
+    assert not state_out.get_stored_state("_stored", owner_path="ZooKeeperCharm").content[
+        "reconcile_hash"
+    ]
+    assert patched_update_cluster.call_count == 2
+
+
+def test_relation_changed_always_runs_for_leader_elected(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"state": "started"},
+        local_app_data={"0": "added"},
+        peers_data={},
+    )
+    restart_peer = PeerRelation("restart", "rolling_op")
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, restart_peer])
+
+    # When
+    with (
+        patch("core.cluster.ClusterState.all_units_related", return_value=True),
+        patch("core.cluster.ClusterState.all_units_declaring_ip", return_value=True),
+        patch("managers.config.ConfigManager.config_changed", return_value=False),
+        patch("managers.quorum.QuorumManager.update_cluster", return_value={}),
+        patch("charm.ZooKeeperCharm.update_quorum") as patched_update_quorum,
+    ):
+        state_out = ctx.run(ctx.on.config_changed(), state_in)
+        ctx.run(ctx.on.leader_elected(), state_out)
+
+    # Then
+    assert patched_update_quorum.call_count == 2
+
+
 def test_restart_fails_not_related(ctx: Context, base_state: State) -> None:
     # Given
     cluster_peer = PeerRelation(PEER, PEER)
@@ -458,7 +665,7 @@ def test_restart_fails_not_added(ctx: Context, base_state: State) -> None:
     patched.assert_not_called()
 
 
-def test_restart_restarts_with_sleep(ctx: Context, base_state: State) -> None:
+def test_restart_waits_for_quorum(ctx: Context, base_state: State) -> None:
     # Given
     cluster_peer = PeerRelation(
         PEER, PEER, local_unit_data={"state": "started"}, local_app_data={"0": "added"}
@@ -471,7 +678,9 @@ def test_restart_restarts_with_sleep(ctx: Context, base_state: State) -> None:
 
     # When
     with (
-        patch("time.sleep") as patched_sleep,
+        patch(
+            "workload.ZKWorkload.ready", new_callable=PropertyMock, return_value=True
+        ) as patched_ready,
         patch("workload.ZKWorkload.restart"),
         patch(
             "core.cluster.ClusterState.stable",
@@ -485,10 +694,11 @@ def test_restart_restarts_with_sleep(ctx: Context, base_state: State) -> None:
         ctx(ctx.on.config_changed(), state_in) as manager,
     ):
         charm = cast(ZooKeeperCharm, manager.charm)
+        patched_ready.reset_mock()
         charm._restart(mock_event)
 
-    # Then
-    patched_sleep.assert_called_once()
+        # Then
+        patched_ready.assert_called_once()
 
 
 def test_restart_restarts_snap_sets_active_status(ctx: Context, base_state: State) -> None:
@@ -514,7 +724,6 @@ def test_restart_restarts_snap_sets_active_status(ctx: Context, base_state: Stat
             new_callable=PropertyMock,
             return_value=Status.ACTIVE,
         ),
-        patch("time.sleep"),
         patch(
             "charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock",
             autospec=True,
@@ -548,7 +757,6 @@ def test_restart_sets_password_rotated_on_unit(ctx: Context, base_state: State)
             new_callable=PropertyMock,
             return_value=Status.ACTIVE,
         ),
-        patch("time.sleep"),
         patch(
             "charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock",
             autospec=True,
@@ -585,7 +793,6 @@ def test_restart_sets_unified(ctx: Context, base_state: State) -> None:
             new_callable=PropertyMock,
             return_value=Status.ACTIVE,
         ),
-        patch("time.sleep"),
         patch(
             "charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock",
             autospec=True,
@@ -612,7 +819,6 @@ def test_restart_sets_unified(ctx: Context, base_state: State) -> None:
             new_callable=PropertyMock,
             return_value=Status.ACTIVE,
         ),
-        patch("time.sleep"),
         patch(
             "charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock",
             autospec=True,
@@ -626,6 +832,19 @@ def test_restart_sets_unified(ctx: Context, base_state: State) -> None:
         assert not charm.state.unit_server.unified
 
 
+def test_layer_cached_per_hook(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER)
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer])
+
+    # When
+    with ctx(ctx.on.config_changed(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+
+        # Then
+        assert charm._layer is charm._layer
+
+
 def test_init_server_waiting_if_no_passwords(ctx: Context, base_state: State) -> None:
     # Given
     cluster_peer = PeerRelation(PEER, PEER)
@@ -1444,3 +1663,80 @@ def test_workload_version_is_setted(ctx: Context, base_state: State, monkeypatch
     # Then
     assert ctx.workload_version_history == [expected_version_installed]
     assert state_out.workload_version == expected_version_changed
+
+
+def test_workload_version_cached_per_hook(
+    ctx: Context, base_state: State, patched_version
+) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER)
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer])
+    (patched_get_version,) = patched_version
+    patched_get_version.return_value = "3.8.1"
+
+    # When
+    with ctx(ctx.on.update_status(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+        charm.workload_version
+        charm.workload_version
+
+        # Then
+        patched_get_version.assert_called_once()
+
+
+def test_update_client_data_skips_jaas_without_acls(ctx: Context, base_state: State) -> None:
+    # Given
+    client_relation = Relation(REL_NAME, "application", remote_app_data={"database": "app"})
+    cluster_peer = PeerRelation(PEER, PEER, local_unit_data={"state": "started"})
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, client_relation])
+
+    # When
+    with (
+        patch(
+            "core.cluster.ClusterState.ready",
+            new_callable=PropertyMock,
+            return_value=Status.ACTIVE,
+        ),
+        patch(
+            "managers.config.ConfigManager.current_jaas", new_callable=PropertyMock
+        ) as patched_jaas,
+        patch("charm.ZooKeeperCharm._reconcile", autospec=True),
+        ctx(ctx.on.update_status(), state_in) as manager,
+    ):
+        charm = cast(ZooKeeperCharm, manager.charm)
+        charm.update_client_data()
+
+        # Then
+        patched_jaas.assert_not_called()
+
+
+def test_relation_changed_requests_certificate_once_for_new_sans(
+    ctx: Context, base_state: State
+) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER, PEER, local_unit_data={"state": "started", "certificate": "old-cert"}
+    )
+    restart_peer = PeerRelation("restart", "rolling_op")
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, restart_peer])
+
+    # When
+    with (
+        patch(
+            "workload.ZKWorkload.exec",
+            return_value="X509v3 Subject Alternative Name:\n    DNS:treebeard, IP Address:1.1.1.1",
+        ),
+        patch(
+            "managers.tls.TLSManager.build_sans",
+            return_value=SANs(sans_ip=["2.2.2.2"], sans_dns=["treebeard"]),
+        ),
+        patch("events.tls.TLSEvents._on_certificate_expiring", autospec=True) as patched_expiring,
+        patch("managers.config.ConfigManager.config_changed", return_value=False),
+        patch("charm.ZooKeeperCharm.update_quorum"),
+    ):
+        state_out = ctx.run(ctx.on.config_changed(), state_in)
+        ctx.run(ctx.on.config_changed(), state_out)
+
+    # Then
+    patched_expiring.assert_called_once()
+    assert not state_out.get_relation(cluster_peer.id).local_unit_data.get("certificate")
@@ -14,6 +14,12 @@ from unittest.mock import DEFAULT, Mock, PropertyMock, patch
 
 import pytest
 import yaml
+from charms.tls_certificates_interface.v3.tls_certificates import (
+    generate_ca,
+    generate_certificate,
+    generate_csr,
+    generate_private_key,
+)
 from ops.testing import Container, Context, PeerRelation, Relation, Secret, State
 
 from charm import ZooKeeperCharm
@@ -363,6 +369,67 @@ def test_renew_certificates_auto_reload(ctx: Context, base_state: State) -> None
     assert unit_data.get("ca-cert", "") == "ca"
 
 
+def test_certificate_available_reconciles_after_deferred_events(
+    ctx: Context, base_state: State
+) -> None:
+    # Given
+    ca_key = generate_private_key()
+    ca = generate_ca(private_key=ca_key, subject="ca").decode("utf-8").strip()
+    csr = generate_csr(private_key=generate_private_key(), subject="zk")
+    certificate = generate_certificate(csr=csr, ca=ca.encode("utf-8"), ca_key=ca_key)
+    csr, certificate = csr.decode("utf-8").strip(), certificate.decode("utf-8").strip()
+
+    provider_data = {
+        "certificates": json.dumps(
+            [
+                {
+                    "certificate_signing_request": csr,
+                    "ca": ca,
+                    "certificate": certificate,
+                    "chain": [ca, certificate],
+                }
+            ]
+        )
+    }
+    requirer_data = {
+        "certificate_signing_requests": json.dumps([{"certificate_signing_request": csr}])
+    }
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"csr": csr, "certificate": "old-cert", "ca-cert": ca},
+    )
+    tls_relation = Relation(
+        CERTS_REL_NAME, TLS_NAME, remote_app_data=provider_data, local_unit_data=requirer_data
+    )
+    deferred = ctx.on.update_status().deferred(ZooKeeperCharm._on_cluster_relation_changed)
+    state_in = dataclasses.replace(
+        base_state, relations=[cluster_peer, tls_relation], deferred=[deferred]
+    )
+
+    # When
+    with (
+        patch.multiple(
+            "managers.tls.TLSManager",
+            set_private_key=DEFAULT,
+            set_ca=DEFAULT,
+            set_chain=DEFAULT,
+            set_bundle=DEFAULT,
+            set_certificate=DEFAULT,
+            set_truststore=DEFAULT,
+            set_p12_keystore=DEFAULT,
+        ),
+        patch("charm.ZooKeeperCharm._reconcile", autospec=True) as patched,
+    ):
+        state_out = ctx.run(ctx.on.relation_changed(tls_relation), state_in)
+
+    # Then
+    assert (
+        state_out.get_relation(cluster_peer.id).local_unit_data.get("certificate") == certificate
+    )
+    assert patched.call_count == 2
+
+
 def test_certificates_available_halfway_through_upgrade_succeeds(
     ctx: Context, base_state: State
 ) -> None:
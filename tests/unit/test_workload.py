@@ -2,11 +2,13 @@
 # Copyright 2022 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import itertools
 import logging
 from pathlib import Path
 from typing import cast
 from unittest.mock import patch
 
+import httpx
 import pytest
 import yaml
 from ops.pebble import ExecError
@@ -22,7 +24,7 @@ ACTIONS = yaml.safe_load(Path("./actions.yaml").read_text())
 METADATA = yaml.safe_load(Path("./metadata.yaml").read_text())
 
 
-# override conftest fixture
+# override conftest fixture, leaving both `healthy` and `ready` unpatched
 @pytest.fixture(autouse=False)
 def patched_healthy():
     yield
@@ -61,3 +63,22 @@ def test_healthy_does_not_raise(ctx: Context, base_state: State, patched_healthy
     ):
         charm = cast(ZooKeeperCharm, manager.charm)
         assert not charm.workload.healthy
+
+
+def test_ready_gives_up_after_delay(ctx: Context, base_state: State) -> None:
+    # Given
+    state_in = base_state
+
+    # When
+    with (
+        patch("httpx.get", side_effect=httpx.ConnectTimeout("timed out")) as patched_get,
+        ctx(ctx.on.update_status(), state_in) as manager,
+    ):
+        charm = cast(ZooKeeperCharm, manager.charm)
+        with patch("tenacity.time.monotonic", side_effect=itertools.count()):
+            ready = charm.workload.ready
+
+    # Then
+    assert not ready
+    assert 1 < patched_get.call_count < 10
+    assert all(call.kwargs["timeout"] < 1 for call in patched_get.call_args_list)